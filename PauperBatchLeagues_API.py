@@ -1,16 +1,18 @@
 import os
+import re
 import random
 import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import WebDriverException, TimeoutException
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+import asyncio
+from dataclasses import dataclass
+from functools import lru_cache
+import httpx
+import orjson
+import diskcache
+from selectolax.lexbor import LexborHTMLParser
 from datetime import datetime, timedelta
-from urllib.parse import urlparse
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ==========================
 # Supabase configuration
@@ -34,18 +36,58 @@ SUPABASE_HEADERS = {
     "Prefer": "return=minimal"
 }
 
+# Rows per insert request; keeps each POST body well under Supabase's request size limit
+SUPABASE_INSERT_CHUNK_SIZE = 1000
+
+# One keep-alive session for every insert, so chunks reuse a warm TLS connection.
+# Inserts are not idempotent: a gateway error, timeout or dropped response may come after the
+# rows were committed. So a POST is only resent on connect errors (nothing was sent) and 429
+# (rejected by rate limiting before reaching the database); read errors are never retried.
+SUPABASE_SESSION = requests.Session()
+SUPABASE_SESSION.headers.update(SUPABASE_HEADERS)
+SUPABASE_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        read=0,
+        other=0,
+        backoff_factor=0.5,
+        status_forcelist=[429],
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    ),
+))
+
+MTGGOLDFISH_BASE_URL = "https://www.mtggoldfish.com"
+
 # ==========================
-# Challenge URL templates
+# Tournament URL templates
 # ==========================
+# No "#online" fragment: it is never sent to the server, so the page is identical without it.
+LEAGUE_URL_TEMPLATE = MTGGOLDFISH_BASE_URL + "/tournament/pauper-league-{date}"
+
 TOURNAMENT_URL_TEMPLATES = [
-    "https://www.mtggoldfish.com/tournament/pauper-challenge-32-{date}#online",
-    "https://www.mtggoldfish.com/tournament/pauper-challenge-32-special-{date}#online",
-    "https://www.mtggoldfish.com/tournament/pauper-showcase-challenge-{date}#online",
+    MTGGOLDFISH_BASE_URL + "/tournament/pauper-challenge-32-{date}",
+    MTGGOLDFISH_BASE_URL + "/tournament/pauper-challenge-32-special-{date}",
+    MTGGOLDFISH_BASE_URL + "/tournament/pauper-showcase-challenge-{date}",
 ]
 
 # Rolling window for challenges (defaults to 15 days)
 CHALLENGE_LOOKBACK_DAYS = int(os.environ.get("CHALLENGE_LOOKBACK_DAYS", "15"))
 
+# ==========================
+# Scrape date windows (fixed for the whole run, oldest first)
+# ==========================
+TODAY = datetime.today().date()
+
+# last 7 days including today
+LEAGUE_DATES = [(TODAY - timedelta(days=i)).isoformat() for i in range(6, -1, -1)]
+
+CHALLENGE_DATES = [
+    (TODAY - timedelta(days=i)).isoformat() for i in range(CHALLENGE_LOOKBACK_DAYS - 1, -1, -1)
+]
+
 TOURNAMENT_REQUEST_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -54,56 +96,99 @@ TOURNAMENT_REQUEST_HEADERS = {
     ),
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.9",
+    # Tournament HTML compresses ~5-10x; brotli decoding comes from the httpx[brotli] extra
+    "Accept-Encoding": "br, gzip",
 }
 
 MTGGOLDFISH_TIMEOUT = int(os.environ.get("MTGGOLDFISH_TIMEOUT", "25"))
 MTGGOLDFISH_MAX_RETRIES = int(os.environ.get("MTGGOLDFISH_MAX_RETRIES", "4"))
 
-SESSION = requests.Session()
-SESSION.headers.update(TOURNAMENT_REQUEST_HEADERS)
+# Max in-flight requests to mtggoldfish, shared by league + challenge fetches
+MTGGOLDFISH_MAX_CONCURRENCY = int(os.environ.get("MTGGOLDFISH_MAX_CONCURRENCY", "8"))
+
+# Statuses worth backing off and retrying; anything else (e.g. 404) is final
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# Response bodies are streamed in chunks of this size and cut off after the results table
+MTGGOLDFISH_READ_CHUNK_SIZE = 8192
+
+# Opening tag of the results table. A bare "table-tournament" (inline CSS, scripts) is not enough.
+TOURNAMENT_TABLE_OPEN_TAG = re.compile(
+    rb"""<table\b[^>]*\bclass\s*=\s*["']?[^"'>]*(?<![\w-])table-tournament(?![\w-])""",
+    re.IGNORECASE,
+)
+# Any opening or closing table tag; group 1 is "/" for closing tags
+TABLE_TAG = re.compile(rb"<(/?)table\b", re.IGNORECASE)
+# How far back each new chunk rescans, so an opening tag split across chunks is still found
+TOURNAMENT_TABLE_TAG_OVERLAP = 1024
+
+# Minimum gap between request starts; longer pauses only happen when mtggoldfish asks via 429/Retry-After
+MTGGOLDFISH_MIN_INTERVAL = float(os.environ.get("MTGGOLDFISH_MIN_INTERVAL", "0.2"))
+MTGGOLDFISH_MAX_RETRY_AFTER = 120.0
 
 # ==========================
-# Selenium setup (GitHub Actions friendly)
+# On-disk page cache (persisted between runs by actions/cache)
 # ==========================
-def setup_driver():
-    options = Options()
-    options.add_argument("--headless=new")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--disable-software-rasterizer")
-    options.add_argument("--disable-extensions")
-    options.add_argument("--disable-infobars")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+MTGGOLDFISH_CACHE_DIR = os.environ.get("MTGGOLDFISH_CACHE_DIR", ".cache/mtggoldfish")
+MTGGOLDFISH_CACHE_TTL = 30 * 86400
 
-    options.page_load_strategy = "eager"
+# Today's and yesterday's results may still be posting, so only older pages are cached
+MTGGOLDFISH_CACHE_MIN_AGE_DAYS = 2
+MTGGOLDFISH_CACHE_CUTOFF = (TODAY - timedelta(days=MTGGOLDFISH_CACHE_MIN_AGE_DAYS)).isoformat()
 
-    options.add_experimental_option("excludeSwitches", ["enable-logging"])
-    options.add_experimental_option("prefs", {
-        "profile.default_content_setting_values": {"images": 2}
-    })
+PAGE_CACHE = diskcache.Cache(MTGGOLDFISH_CACHE_DIR)
 
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.set_page_load_timeout(45)
-    driver.set_script_timeout(45)
-    return driver
+# ==========================
+# Insert row types (orjson serializes dataclasses natively, in field order)
+# ==========================
+@dataclass(slots=True)
+class LeagueRow:
+    id: int
+    event_date: str
+    place: str
+    deck_name: str
+    pilot: str
+    deck_url: str
+
+
+@dataclass(slots=True)
+class ChallengeRow:
+    deck_id: int
+    date: str
+    place: str
+    deck_name: str
+    pilot: str
+    json_decklist: dict | None = None
 
 # ==========================
 # Helper: extract numeric deck ID from URL
 # ==========================
+# Decks recur across dates and templates; a repeated URL is only parsed (and warned about) once
+@lru_cache(maxsize=4096)
 def get_deck_id(deck_url: str):
-    try:
-        parsed = urlparse(deck_url)
-        path_last = parsed.path.rstrip("/").split("/")[-1]
-        if path_last.isdigit():
-            return int(path_last)
-        print(f"WARNING: could not extract numeric id from URL: {deck_url}")
-        return None
-    except Exception as e:
-        print(f"ERROR: Exception parsing deck URL {deck_url}: {e}")
-        return None
+    # Deck URLs are always ".../deck/<id>[#online]", so plain string splits beat urlparse
+    path = deck_url.split("#", 1)[0].split("?", 1)[0].rstrip("/")
+    path_last = path.rpartition("/")[2]
+    if path_last.isdigit():
+        return int(path_last)
+    print(f"WARNING: could not extract numeric id from URL: {deck_url}")
+    return None
+
+# ==========================
+# Helper: first N cells of a table row
+# ==========================
+def first_cells(row, count: int = 3) -> list:
+    """
+    Return up to `count` direct <td> children of a row, stopping as soon as they are found.
+    Only place/deck/pilot are read, so trailing round/archetype columns are never visited.
+    """
+    cells = []
+    for node in row.iter():
+        if node.tag == "td":
+            cells.append(node)
+            if len(cells) == count:
+                break
+    return cells
 
 # ==========================
 # Helper: detect challenge/interstitial pages
@@ -123,307 +208,429 @@ def looks_like_challenge_page(html: str) -> bool:
     return any(marker in body for marker in markers)
 
 # ==========================
-# Helper: robust driver.get with retries
+# Adaptive request throttle
 # ==========================
-def load_page_with_retries(driver, url: str, max_retries: int = 2, sleep_after: float = 2.0):
-    retry_count = 0
-    while retry_count < max_retries:
-        try:
-            driver.get(url)
-            time.sleep(sleep_after)
-            return True
-        except TimeoutException:
-            retry_count += 1
-            if retry_count < max_retries:
-                print(f"⚠ Timeout on attempt {retry_count}, retrying...")
-                try:
-                    driver.execute_script("window.stop();")
-                except Exception:
-                    pass
-                time.sleep(1)
+_throttle_lock = asyncio.Lock()
+_next_request_at = 0.0
+
+
+async def wait_for_request_slot():
+    global _next_request_at
+
+    async with _throttle_lock:
+        wait = _next_request_at - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        _next_request_at = time.monotonic() + MTGGOLDFISH_MIN_INTERVAL
+
+
+def defer_requests(seconds: float):
+    """Hold back every pending request, not just the one that was rate limited."""
+    global _next_request_at
+    _next_request_at = max(_next_request_at, time.monotonic() + seconds)
+
+
+def parse_retry_after(value) -> float | None:
+    # Only the delay-seconds form is handled; HTTP-date values fall back to exponential backoff
+    if value and value.strip().isdigit():
+        return min(float(value.strip()), MTGGOLDFISH_MAX_RETRY_AFTER)
+    return None
+
+# ==========================
+# Async page fetching (httpx, HTTP/2)
+# ==========================
+async def read_until_table_end(response: httpx.Response) -> str:
+    """
+    Stream the body and stop once the table.table-tournament element has closed.
+    Everything after it (footer, scripts) is never downloaded, buffered or parsed.
+    Pages without the table (missing tournaments, bot checks) are read in full.
+    """
+    buf = bytearray()
+    table_start = -1
+
+    async for chunk in response.aiter_bytes(MTGGOLDFISH_READ_CHUNK_SIZE):
+        # Rescan the tail of the previous chunk in case the opening tag straddles the boundary
+        scan_from = max(0, len(buf) - TOURNAMENT_TABLE_TAG_OVERLAP)
+        buf += chunk
+
+        if table_start < 0:
+            match = TOURNAMENT_TABLE_OPEN_TAG.search(buf, scan_from)
+            if not match:
+                continue
+            table_start = match.start()
+
+        # Count tags instead of stopping at the first </table> in case cells ever nest tables
+        opened = closed = 0
+        for tag in TABLE_TAG.finditer(buf, table_start):
+            if tag.group(1):
+                closed += 1
             else:
-                print(f"✗ Page failed to load after {max_retries} attempts: {url}")
-                return False
-    return False
+                opened += 1
+        if closed and closed >= opened:
+            break
 
+    return bytes(buf).decode(response.charset_encoding or "utf-8", errors="replace")
 
-def fetch_page_html_with_requests(url: str) -> str:
+
+async def fetch(session: httpx.AsyncClient, sem: asyncio.BoundedSemaphore, url: str) -> str:
     for attempt in range(1, MTGGOLDFISH_MAX_RETRIES + 1):
         try:
-            response = SESSION.get(url, timeout=MTGGOLDFISH_TIMEOUT)
-            html = response.text or ""
-
-            if response.status_code == 200 and not looks_like_challenge_page(html):
+            # Only the request itself holds a slot; backoff sleeps happen outside it.
+            async with sem:
+                await wait_for_request_slot()
+                async with session.stream("GET", url) as response:
+                    status = response.status_code
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    html = await read_until_table_end(response)
+
+            blocked = looks_like_challenge_page(html)
+            if status == 200 and not blocked:
                 return html
 
-            wait = min(30.0, (2 ** (attempt - 1)) + random.uniform(1.0, 3.0))
+            if status not in RETRYABLE_STATUSES and not blocked:
+                print(f"  -> HTTP {status} for {url}")
+                return ""
+
+            if attempt == MTGGOLDFISH_MAX_RETRIES:
+                print(f"✗ Tournament fetch still blocked ({status}) after {attempt} attempts: {url}")
+                break
+
+            if retry_after is not None:
+                wait = retry_after
+                defer_requests(wait)
+            else:
+                wait = min(30.0, (2 ** (attempt - 1)) + random.uniform(1.0, 3.0))
             print(
-                f"⚠ Tournament fetch looked blocked ({response.status_code}). "
+                f"⚠ Tournament fetch looked blocked ({status}). "
                 f"Backing off {wait:.1f}s (attempt {attempt}/{MTGGOLDFISH_MAX_RETRIES})"
             )
-            time.sleep(wait)
-        except requests.RequestException as e:
+            await asyncio.sleep(wait)
+        except httpx.HTTPError as e:
+            if attempt == MTGGOLDFISH_MAX_RETRIES:
+                print(f"✗ Request error fetching tournament page after {attempt} attempts: {e!r}")
+                break
+
             wait = min(30.0, (2 ** (attempt - 1)) + random.uniform(1.0, 3.0))
             print(
-                f"⚠ Request error fetching tournament page: {e}. "
+                f"⚠ Request error fetching tournament page: {e!r}. "
                 f"Backing off {wait:.1f}s (attempt {attempt}/{MTGGOLDFISH_MAX_RETRIES})"
             )
-            time.sleep(wait)
+            await asyncio.sleep(wait)
 
     return ""
 
+# ==========================
+# Cached page fetching
+# ==========================
+def is_cacheable_date(date_str: str) -> bool:
+    # ISO dates order the same as strings, so no parsing is needed
+    return date_str <= MTGGOLDFISH_CACHE_CUTOFF
 
-def fetch_page_html(driver, url: str, max_retries: int = 2, sleep_after: float = 2.0) -> str:
-    html = fetch_page_html_with_requests(url)
-    if html:
-        return html
 
-    ok = load_page_with_retries(driver, url, max_retries=max_retries, sleep_after=sleep_after)
-    if not ok:
-        return ""
+async def fetch_cached(session: httpx.AsyncClient, sem: asyncio.BoundedSemaphore, url: str, date_str: str) -> str:
+    if not is_cacheable_date(date_str):
+        return await fetch(session, sem, url)
+
+    html = PAGE_CACHE.get(url)
+    if html is not None:
+        return html
 
-    return driver.page_source or ""
+    html = await fetch(session, sem, url)
+    if html:
+        PAGE_CACHE.set(url, html, expire=MTGGOLDFISH_CACHE_TTL)
+    return html
 
 # ==========================
-# Challenge scraping helper
+# League scraping helper
 # ==========================
-def scrape_challenge_for_date(driver, date_str: str):
+async def scrape_league_for_date(session: httpx.AsyncClient, sem: asyncio.BoundedSemaphore, date_str: str):
     """
-    Try all Challenge URL templates for a given date.
-    Returns a payload list (records) or [].
+    Fetch and parse the Pauper League page for a given date.
+    Returns a list of LeagueRow or [].
     """
-    for template in TOURNAMENT_URL_TEMPLATES:
-        url = template.format(date=date_str)
-        print(f"Trying Challenge URL: {url}")
+    url = LEAGUE_URL_TEMPLATE.format(date=date_str)
+    print(f"LEAGUE | Scraping URL: {url}")
 
-        html = fetch_page_html(driver, url, max_retries=2, sleep_after=2.0)
+    try:
+        html = await fetch_cached(session, sem, url, date_str)
         if not html:
-            continue
+            return []
+
+        # A substring scan is far cheaper than parsing a page that has no results table
+        if "table-tournament" not in html:
+            print(f"Table not found for {date_str} (tournament may not exist)")
+            return []
+
+        tree = LexborHTMLParser(html)
+        table = tree.css_first("table.table-tournament")
 
-        soup = BeautifulSoup(html, "html.parser")
-        table = soup.find("table", class_="table-tournament")
         if not table:
-            print(f"  -> No tournament table found at {url}")
-            continue
+            print(f"Table not found for {date_str} (tournament may not exist)")
+            return []
 
-        row_container = table.find("tbody") or table
-        rows = row_container.find_all("tr", recursive=False)
-        if not rows:
-            print(f"  -> Tournament table empty at {url}")
-            continue
+        # Lexbor follows the HTML5 algorithm, so bare <tr> rows always end up inside a <tbody>
+        rows = table.css("table.table-tournament > tbody > tr")
+        print(f"Found {len(rows)} rows in league table for {date_str}")
 
-        records = []
+        # Keyed by primary key so repeated rows are only sent to Supabase once
+        payload = {}
 
         for row in rows:
-            cols = row.find_all("td")
+            cols = first_cells(row, 3)
             if len(cols) < 3:
                 continue
 
-            place = cols[0].get_text(strip=True)
-
-            deck_link_tag = cols[1].find("a")
-            if not deck_link_tag or "href" not in deck_link_tag.attrs:
+            # Resolve the deck link first so rejected rows never pay for text extraction
+            a_tag = cols[1].css_first("a")
+            href = a_tag.attributes.get("href") if a_tag else None
+            if not href:
                 continue
 
-            deck_name = deck_link_tag.get_text(strip=True)
-            deck_url = "https://www.mtggoldfish.com" + deck_link_tag["href"]
+            deck_url = MTGGOLDFISH_BASE_URL + href
             deck_id = get_deck_id(deck_url)
             if deck_id is None:
                 continue
 
-            pilot_name = cols[2].get_text(strip=True)
+            place = cols[0].text().strip()
+            deck_name = cols[1].text().strip()
+            pilot_name = cols[2].text().strip()
+
+            payload[(deck_id, date_str)] = LeagueRow(
+                id=deck_id,
+                event_date=date_str,
+                place=place,
+                deck_name=deck_name,
+                pilot=pilot_name,
+                deck_url=deck_url,
+            )
 
-            records.append({
-                "deck_id": deck_id,
-                "date": date_str,
-                "place": place,
-                "deck_name": deck_name,
-                "pilot": pilot_name,
-                "json_decklist": None
-            })
+        return list(payload.values())
 
-        if records:
-            print(f"  -> Found {len(records)} rows at {url}")
-            return records
+    except Exception as e:
+        print(f"✗ Unexpected error scraping league {date_str}: {e}")
 
-    print(f"❌ No valid Challenge page found for {date_str} (normal/special/showcase).")
     return []
 
 # ==========================
-# Main scraping logic
+# Challenge scraping helper
 # ==========================
-def main():
-    driver = None
+async def scrape_challenge_for_date(session: httpx.AsyncClient, sem: asyncio.BoundedSemaphore, date_str: str):
+    """
+    Try all Challenge URL templates for a given date.
+    Returns a list of ChallengeRow or [].
+    """
+    # dict.fromkeys keeps template order while dropping any templates that collide
+    urls = list(dict.fromkeys(template.format(date=date_str) for template in TOURNAMENT_URL_TEMPLATES))
+    for url in urls:
+        print(f"Trying Challenge URL: {url}")
 
-    try:
-        driver = setup_driver()
-        print("Chrome driver initialized successfully")
-
-        # --------------------------
-        # PART 1: Pauper Leagues
-        # --------------------------
-        today = datetime.today()
-        start_date = today - timedelta(days=6)  # last 7 days including today
-        end_date = today
-
-        current_date = start_date
-        total_league_rows_inserted = 0
-
-        while current_date <= end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-            url = f"https://www.mtggoldfish.com/tournament/pauper-league-{date_str}#online"
-
-            print(f"\n{'='*60}")
-            print(f"LEAGUE | Scraping URL: {url}")
-            print(f"{'='*60}")
-
-            try:
-                html = fetch_page_html(driver, url, max_retries=2, sleep_after=2.0)
-                if not html:
-                    current_date += timedelta(days=1)
+    # Fetch every template at once, then keep the first one (in template order) with rows.
+    pages = await asyncio.gather(
+        *(fetch_cached(session, sem, url, date_str) for url in urls),
+        return_exceptions=True,
+    )
+
+    for url, html in zip(urls, pages):
+        if isinstance(html, Exception):
+            print(f"  -> Error fetching {url}: {html}")
+            continue
+        if not html:
+            continue
+
+        # One bad page must not abort the whole challenge phase (and, via gather, the leagues)
+        try:
+            if "table-tournament" not in html:
+                print(f"  -> No tournament table found at {url}")
+                continue
+
+            tree = LexborHTMLParser(html)
+            table = tree.css_first("table.table-tournament")
+            if not table:
+                print(f"  -> No tournament table found at {url}")
+                continue
+
+            rows = table.css("table.table-tournament > tbody > tr")
+            if not rows:
+                print(f"  -> Tournament table empty at {url}")
+                continue
+
+            # Keyed by primary key so repeated rows are only sent to Supabase once
+            records = {}
+
+            for row in rows:
+                cols = first_cells(row, 3)
+                if len(cols) < 3:
                     continue
 
-                soup = BeautifulSoup(html, "html.parser")
-                table = soup.find("table", class_="table-tournament")
+                # Resolve the deck link first so rejected rows never pay for text extraction
+                deck_link_tag = cols[1].css_first("a")
+                href = deck_link_tag.attributes.get("href") if deck_link_tag else None
+                if not href:
+                    continue
 
-                if not table:
-                    print(f"Table not found for {date_str} (tournament may not exist)")
-                    current_date += timedelta(days=1)
-                    time.sleep(1)
+                deck_url = MTGGOLDFISH_BASE_URL + href
+                deck_id = get_deck_id(deck_url)
+                if deck_id is None:
                     continue
 
-                row_container = table.find("tbody") or table
-                rows = row_container.find_all("tr", recursive=False)
-                print(f"Found {len(rows)} rows in league table")
-
-                payload = []
-
-                for row in rows:
-                    cols = row.find_all("td")
-                    if len(cols) < 3:
-                        continue
-
-                    place = cols[0].text.strip()
-                    deck_name = cols[1].text.strip()
-                    pilot_name = cols[2].text.strip()
-
-                    a_tag = cols[1].find("a")
-                    if not a_tag or "href" not in a_tag.attrs:
-                        continue
-
-                    deck_url = "https://www.mtggoldfish.com" + a_tag["href"]
-                    deck_id = get_deck_id(deck_url)
-                    if deck_id is None:
-                        continue
-
-                    payload.append({
-                        "id": deck_id,
-                        "event_date": date_str,
-                        "place": place,
-                        "deck_name": deck_name,
-                        "pilot": pilot_name,
-                        "deck_url": deck_url
-                    })
-
-                if payload:
-                    print(f"Attempting to insert {len(payload)} league rows into Supabase...")
-                    resp = requests.post(
-                        SUPABASE_LEAGUE_INSERT_ENDPOINT,
-                        headers=SUPABASE_HEADERS,
-                        data=json.dumps(payload),
-                        timeout=30
-                    )
-
-                    if resp.status_code in (200, 201, 204):
-                        print(f"✓ League insert OK for {date_str} ({len(payload)} rows)")
-                        total_league_rows_inserted += len(payload)
-                    else:
-                        print(f"✗ League insert FAILED for {date_str}.")
-                        print(f"  Status: {resp.status_code}")
-                        print(f"  Body: {resp.text[:500]}")
-                else:
-                    print(f"No valid league rows to insert for {date_str}")
-
-            except TimeoutException:
-                print(f"✗ Timeout loading league page for {date_str} - skipping")
-            except WebDriverException as e:
-                print(f"✗ WebDriver error for league {date_str}: {e}")
-            except Exception as e:
-                print(f"✗ Unexpected error scraping league {date_str}: {e}")
-
-            time.sleep(1)
-            current_date += timedelta(days=1)
-
-        print(f"\n{'='*60}")
-        print(f"Leagues complete! Total rows inserted: {total_league_rows_inserted}")
-        print(f"{'='*60}")
-
-        # --------------------------
-        # PART 2: Pauper Challenges
-        # --------------------------
-        challenge_end = datetime.today().date()
-        challenge_start = challenge_end - timedelta(days=CHALLENGE_LOOKBACK_DAYS - 1)
-
-        print(f"\n{'='*60}")
-        print(f"CHALLENGES | Rolling range: {challenge_start.isoformat()} -> {challenge_end.isoformat()} "
-              f"({CHALLENGE_LOOKBACK_DAYS} days)")
-        print(f"{'='*60}")
-
-        total_challenge_rows_inserted = 0
-        current_day = challenge_start
-
-        while current_day <= challenge_end:
-            date_str = current_day.isoformat()
-            print(f"\n=== CHALLENGE | Processing {date_str} ===")
-
-            records = scrape_challenge_for_date(driver, date_str)
-
-            if not records:
-                print(f"No challenge data to insert for {date_str}.")
-                current_day += timedelta(days=1)
-                time.sleep(1)
-                continue
+                place = cols[0].text(strip=True)
+                deck_name = deck_link_tag.text(strip=True)
+                pilot_name = cols[2].text(strip=True)
 
-            try:
-                print(f"Attempting to insert {len(records)} challenge rows into Supabase...")
-                resp = requests.post(
-                    SUPABASE_CHALLENGE_INSERT_ENDPOINT,
-                    headers=SUPABASE_HEADERS,
-                    data=json.dumps(records),
-                    timeout=30
+                records[(deck_id, date_str)] = ChallengeRow(
+                    deck_id=deck_id,
+                    date=date_str,
+                    place=place,
+                    deck_name=deck_name,
+                    pilot=pilot_name,
                 )
 
-                if resp.status_code in (200, 201, 204):
-                    print(f"✓ Challenge insert OK for {date_str} ({len(records)} rows)")
-                    total_challenge_rows_inserted += len(records)
-                else:
-                    print(f"✗ Challenge insert FAILED for {date_str}.")
-                    print(f"  Status: {resp.status_code}")
-                    print(f"  Body: {resp.text[:500]}")
-            except requests.exceptions.RequestException as e:
-                print(f"✗ Network error inserting challenge data for {date_str}: {e}")
-            except Exception as e:
-                print(f"✗ Unexpected error inserting challenge data for {date_str}: {e}")
+            if records:
+                print(f"  -> Found {len(records)} rows at {url}")
+                return list(records.values())
+        except Exception as e:
+            print(f"✗ Unexpected error parsing challenge page {url}: {e}")
+
+    print(f"❌ No valid Challenge page found for {date_str} (normal/special/showcase).")
+    return []
+
+# ==========================
+# Supabase insert helper
+# ==========================
+def insert_rows(endpoint: str, rows: list, label: str) -> int:
+    """
+    POST rows to a Supabase insert view, SUPABASE_INSERT_CHUNK_SIZE rows per request.
+    Returns the number of rows inserted.
+    """
+    inserted = 0
+
+    for start in range(0, len(rows), SUPABASE_INSERT_CHUNK_SIZE):
+        chunk = rows[start:start + SUPABASE_INSERT_CHUNK_SIZE]
+
+        try:
+            print(f"Attempting to insert {len(chunk)} {label} rows into Supabase...")
+            resp = SUPABASE_SESSION.post(endpoint, data=orjson.dumps(chunk), timeout=30)
+
+            if resp.status_code in (200, 201, 204):
+                print(f"✓ {label.capitalize()} insert OK ({len(chunk)} rows)")
+                inserted += len(chunk)
+            else:
+                print(f"✗ {label.capitalize()} insert FAILED.")
+                print(f"  Status: {resp.status_code}")
+                print(f"  Body: {resp.text[:500]}")
+        except requests.exceptions.RequestException as e:
+            print(f"✗ Network error inserting {label} data: {e}")
+
+    return inserted
+
+# ==========================
+# PART 1: Pauper Leagues
+# ==========================
+async def run_leagues(session: httpx.AsyncClient, sem: asyncio.BoundedSemaphore) -> int:
+    print(f"\n{'='*60}")
+    print(f"LEAGUES | Fetching {len(LEAGUE_DATES)} dates: {LEAGUE_DATES[0]} -> {LEAGUE_DATES[-1]}")
+    print(f"{'='*60}")
 
-            time.sleep(1)
-            current_day += timedelta(days=1)
+    payloads = await asyncio.gather(*(scrape_league_for_date(session, sem, d) for d in LEAGUE_DATES))
 
-        print(f"\n{'='*60}")
-        print(f"Challenges complete! Total rows inserted: {total_challenge_rows_inserted}")
-        print(f"{'='*60}")
+    all_league_payload = []
 
-        print(f"\nALL DONE ✅ | League rows: {total_league_rows_inserted} | Challenge rows: {total_challenge_rows_inserted}")
+    for date_str, payload in zip(LEAGUE_DATES, payloads):
+        if not payload:
+            print(f"No valid league rows to insert for {date_str}")
+            continue
+        all_league_payload.extend(payload)
+
+    # Run the blocking insert off the event loop so challenge fetches keep going meanwhile
+    total_league_rows_inserted = await asyncio.to_thread(
+        insert_rows, SUPABASE_LEAGUE_INSERT_ENDPOINT, all_league_payload, "league"
+    )
+
+    print(f"\n{'='*60}")
+    print(f"Leagues complete! Total rows inserted: {total_league_rows_inserted}")
+    print(f"{'='*60}")
+
+    return total_league_rows_inserted
+
+# ==========================
+# PART 2: Pauper Challenges
+# ==========================
+async def run_challenges(session: httpx.AsyncClient, sem: asyncio.BoundedSemaphore) -> int:
+    print(f"\n{'='*60}")
+    print(f"CHALLENGES | Rolling range: {CHALLENGE_DATES[0]} -> {CHALLENGE_DATES[-1]} "
+          f"({CHALLENGE_LOOKBACK_DAYS} days)")
+    print(f"{'='*60}")
 
+    all_records = await asyncio.gather(*(scrape_challenge_for_date(session, sem, d) for d in CHALLENGE_DATES))
+
+    all_challenge_records = []
+
+    for date_str, records in zip(CHALLENGE_DATES, all_records):
+        if not records:
+            print(f"No challenge data to insert for {date_str}.")
+            continue
+        all_challenge_records.extend(records)
+
+    total_challenge_rows_inserted = await asyncio.to_thread(
+        insert_rows, SUPABASE_CHALLENGE_INSERT_ENDPOINT, all_challenge_records, "challenge"
+    )
+
+    print(f"\n{'='*60}")
+    print(f"Challenges complete! Total rows inserted: {total_challenge_rows_inserted}")
+    print(f"{'='*60}")
+
+    return total_challenge_rows_inserted
+
+# ==========================
+# Main scraping logic
+# ==========================
+async def scrape_all():
+    sem = asyncio.BoundedSemaphore(MTGGOLDFISH_MAX_CONCURRENCY)
+    # HTTP/2 multiplexes every page over one TLS connection, and cutting a body short
+    # (read_until_table_end) only resets that stream instead of dropping the connection
+    limits = httpx.Limits(
+        max_connections=MTGGOLDFISH_MAX_CONCURRENCY,
+        max_keepalive_connections=MTGGOLDFISH_MAX_CONCURRENCY,
+    )
+    async with httpx.AsyncClient(
+        http2=True,
+        headers=TOURNAMENT_REQUEST_HEADERS,
+        limits=limits,
+        timeout=MTGGOLDFISH_TIMEOUT,
+    ) as session:
+        # The phases share nothing but the fetch semaphore, so their network waits overlap.
+        # return_exceptions keeps a failure in one phase from cancelling the other's insert.
+        results = await asyncio.gather(
+            run_leagues(session, sem),
+            run_challenges(session, sem),
+            return_exceptions=True,
+        )
+
+    failures = []
+    totals = []
+    for phase, result in zip(("League", "Challenge"), results):
+        if isinstance(result, Exception):
+            print(f"✗ {phase} phase failed: {result!r}")
+            failures.append(result)
+            result = 0
+        totals.append(result)
+    total_league_rows_inserted, total_challenge_rows_inserted = totals
+
+    print(f"\nALL DONE ✅ | League rows: {total_league_rows_inserted} | Challenge rows: {total_challenge_rows_inserted}")
+
+    # Still fail the run (and the workflow) once the healthy phase has finished inserting
+    if failures:
+        raise failures[0]
+
+
+def main():
+    try:
+        asyncio.run(scrape_all())
     except Exception as e:
         print(f"FATAL ERROR: {e}")
         raise
     finally:
-        if driver:
-            try:
-                driver.quit()
-                print("Chrome driver closed successfully")
-            except Exception as e:
-                print(f"Error closing driver: {e}")
+        PAGE_CACHE.close()
 
 if __name__ == "__main__":
     main()
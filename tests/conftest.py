@@ -0,0 +1,10 @@
+import os
+import sys
+import tempfile
+
+# The scraper reads its configuration at import time
+os.environ.setdefault("SUPABASE_URL", "https://example.supabase.co")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE", "test-service-role")
+os.environ.setdefault("MTGGOLDFISH_CACHE_DIR", tempfile.mkdtemp(prefix="mtggoldfish-cache-"))
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
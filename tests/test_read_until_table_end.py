@@ -0,0 +1,79 @@
+import asyncio
+
+import PauperBatchLeagues_API as scraper
+
+TABLE = (
+    b'<table class="table table-tournament"><tbody>'
+    b'<tr><td>1st</td><td><a href="/deck/123">Affinity</a></td><td>alice</td></tr>'
+    b"</tbody></table>"
+)
+FOOTER = b"<footer>" + b"x" * 50000 + b"</footer></body></html>"
+
+
+class FakeResponse:
+    charset_encoding = "utf-8"
+
+    def __init__(self, body: bytes, chunk_size: int):
+        self._chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+
+    async def aiter_bytes(self, chunk_size=None):
+        for chunk in self._chunks:
+            yield chunk
+
+
+def read(body: bytes, chunk_size: int) -> str:
+    return asyncio.run(scraper.read_until_table_end(FakeResponse(body, chunk_size)))
+
+
+def test_opening_tag_split_across_chunks():
+    head = b"<html><body>" + b"y" * 100
+    split_at = len(head) + TABLE.index(b"tournament")
+    body = head + TABLE + FOOTER
+
+    html = read(body, split_at)
+
+    assert TABLE.decode() in html
+    assert len(html) < len(body)
+
+
+def test_marker_before_table_does_not_stop_reading():
+    head = (
+        b"<html><head><style>.table-tournament{width:100%}</style></head><body>"
+        b"<table class=\"nav\"><tr><td>menu</td></tr></table>"
+        + b"z" * 9000
+    )
+    body = head + TABLE + FOOTER
+
+    html = read(body, 4096)
+
+    assert TABLE.decode() in html
+
+
+def test_page_without_table_is_read_in_full():
+    body = b"<html><head><style>.table-tournament{}</style></head><body>" + FOOTER
+
+    assert read(body, 4096) == body.decode()
+
+
+def test_similar_class_name_does_not_start_table():
+    head = (
+        b"<html><body>"
+        b"<table class='table-tournament-nav'><tr><td>menu</td></tr></table>"
+        + b"z" * 20000
+    )
+    body = head + TABLE + FOOTER
+
+    html = read(body, 8192)
+
+    assert TABLE.decode() in html
+
+
+def test_uppercase_table_tags_are_counted():
+    rows = b"<TR><TD>1st</TD><TD>Affinity</TD><TD>alice</TD></TR>" * 50
+    table = b"<TABLE class='table table-tournament'><TBODY>" + rows + b"</TBODY></TABLE>"
+    body = b"<html><body>" + table + FOOTER
+
+    html = read(body, 64)
+
+    assert table.decode() in html
+    assert len(html) < len(body)